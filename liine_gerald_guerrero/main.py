@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .services import RestaurantService
@@ -18,10 +19,8 @@ from .services import RestaurantService
 restaurant_service = RestaurantService()
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Handle application startup and shutdown."""
-    # Startup
+def load_restaurant_data() -> None:
+    """Load restaurant data from the CSV file configured in the environment."""
     csv_file_path = os.getenv("RESTAURANTS_CSV_FILE", "restaurants.csv")
     
     if os.path.exists(csv_file_path):
@@ -32,6 +31,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             print(f"Warning: Could not load restaurant data: {exc}")
     else:
         print(f"Warning: Restaurant CSV file not found at {csv_file_path}")
+
+
+# Load at import so gunicorn --preload parses the CSV once in the parent process
+# and forked workers share the data, set PRELOAD_CSV=0 to load on startup instead
+if os.getenv("PRELOAD_CSV", "1") != "0":
+    load_restaurant_data()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Handle application startup and shutdown."""
+    # Startup, only needed when the data was not preloaded at import
+    if not restaurant_service.is_loaded():
+        load_restaurant_data()
     
     yield
     
@@ -61,7 +74,8 @@ app = FastAPI(
     title="Restaurant Hours API",
     description="API for querying restaurant opening hours",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -74,10 +88,12 @@ async def health_check() -> HealthResponse:
     )
 
 
-@app.get("/restaurants/open", response_model=RestaurantsResponse)
-async def get_open_restaurants(
+# Declared as a plain function so FastAPI runs the parsing and lookup
+# in its threadpool instead of blocking the event loop
+@app.get("/restaurants/open", response_model=RestaurantsResponse, response_class=ORJSONResponse)
+def get_open_restaurants(
     datetime_param: str = Query(..., alias="datetime")
-) -> RestaurantsResponse:
+) -> ORJSONResponse:
     """
     Find restaurants that are open at the time given by user input.
     
@@ -92,7 +108,9 @@ async def get_open_restaurants(
     
     try:
         open_restaurants = restaurant_service.find_open_restaurants(datetime_param)
-        return RestaurantsResponse(restaurants=open_restaurants)
+        # Names come from the loaded data, so return ORJSONResponse directly
+        # and skip response model validation
+        return ORJSONResponse({"restaurants": open_restaurants})
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -105,8 +123,8 @@ async def get_open_restaurants(
         ) from exc
 
 
-@app.get("/restaurants/count", response_model=CountResponse)
-async def get_restaurant_count() -> CountResponse:
+@app.get("/restaurants/count", response_model=CountResponse, response_class=ORJSONResponse)
+async def get_restaurant_count() -> ORJSONResponse:
     """
     Returns total number of loaded restaurants
     """
@@ -117,9 +135,17 @@ async def get_restaurant_count() -> CountResponse:
         )
     
     count = restaurant_service.get_restaurant_count()
-    return CountResponse(count=count)
+    return ORJSONResponse({"count": count})
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # uvloop and httptools come from the uvicorn[standard] extra, use the
+    # gunicorn --preload command in the README to run multiple workers
+    uvicorn.run(
+        app,
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools"
+    ) 
\ No newline at end of file
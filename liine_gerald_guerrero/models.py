@@ -1,57 +1,39 @@
 """
 Basic data models for restaurant hours.
 
-Simple classes to represent restaurants, schedules, and time ranges.
+Simple classes to represent restaurants and their weekly hours.
 """
 
-from datetime import datetime, time
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from datetime import datetime
 
 
-class TimeRange(BaseModel):
-    """A time range like 9am-5pm."""
-    start: time
-    end: time
-    
-    def contains_time(self, check_time: time) -> bool:
-        """
-        Check if a given time falls within this time range.
-        
-        Handles overnight edge cases like 11pm-2am too.
-        """
-        if self.start <= self.end:
-            # Normal range (e.g., 9:00 AM - 5:00 PM)
-            return self.start <= check_time <= self.end
-        else:
-            # Overnight range (e.g., 11:00 PM - 2:00 AM)
-            return check_time >= self.start or check_time <= self.end
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
 
 
-class DaySchedule(BaseModel):
-    """What times a place is open on one day."""
-    time_ranges: list = []
-    
-    def is_open_at_time(self, check_time: time) -> bool:
-        """
-        Check if open at given time
-        """
-        return any(time_range.contains_time(check_time) for time_range in self.time_ranges)
+def minute_of_week(dt: datetime) -> int:
+    """Convert a datetime into its minute offset from Monday 00:00."""
+    return dt.weekday() * MINUTES_PER_DAY + dt.hour * 60 + dt.minute
 
 
-class Restaurant(BaseModel):
+@dataclass(slots=True)
+class Restaurant:
     """A restaurant with its name and weekly hours."""
     name: str
-    schedule: dict = {}  # Maps weekday (0-6) to DaySchedule
+    schedule: dict = field(default_factory=dict)  # Maps weekday (0-6) to (start, end) minute-of-day tuples
+    mask: int = field(default=0, repr=False)  # One bit per minute of the week, set while the restaurant is open
+    open_days: tuple = ()  # Weekdays (0-6) listed in the hours, without overnight carry-over
+    
+    def is_open_at_minute(self, week_minute: int) -> bool:
+        """
+        Check if the restaurant is open at a given minute of the week.
+        """
+        return bool(self.mask >> week_minute & 1)
     
     def is_open_at_datetime(self, dt: datetime) -> bool:
         """
         Check if the restaurant is open at a specific time.
 
         """
-        weekday = dt.weekday()  # 0 = Monday, 6 = Sunday
-        
-        if weekday not in self.schedule:
-            return False
-        
-        day_schedule = self.schedule[weekday]
-        return day_schedule.is_open_at_time(dt.time()) 
\ No newline at end of file
+        return self.is_open_at_minute(minute_of_week(dt))
@@ -6,18 +6,36 @@ from strings into structured data
 """
 
 import csv
+import functools
 import re
+from collections.abc import Iterable
 from datetime import time
 from io import StringIO
 
-from .models import Restaurant, DaySchedule, TimeRange
+from .models import MINUTES_PER_DAY, Restaurant
 
 
+# Compiled once at import instead of on every parse call
+_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)')
+_PERIOD_RE = re.compile(
+    r'^(.*?)\s+(\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*-\s*(\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*$',
+    re.IGNORECASE
+)
+
+# Built once and shared by every parse_day_range call
+_DAY_MAP: dict[str, int] = {
+    'mon': 0, 'tue': 1, 'tues': 1, 'wed': 2, 'thu': 3, 'thurs': 3,
+    'fri': 4, 'sat': 5, 'sun': 6
+}
+
+
+@functools.lru_cache(maxsize=2048)
 def parse_time_string(time_str: str) -> time:
     """
     Convert time input from string, like "11:30 am", into a proper time object.
     
     Handles edge cases, "12 am" (midnight) and "12 pm" (noon), correctly.
+    Results are cached, so repeated strings share one interned time object.
     """
     time_str = time_str.strip().lower()
     
@@ -28,8 +46,7 @@ def parse_time_string(time_str: str) -> time:
         return time(12, 0)
     
     # Regular time parsing
-    time_pattern = r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)'
-    match = re.match(time_pattern, time_str)
+    match = _TIME_RE.match(time_str)
     
     if not match:
         raise ValueError(f"Cannot parse time string: {time_str}")
@@ -44,25 +61,30 @@ def parse_time_string(time_str: str) -> time:
     elif am_pm == 'am' and hour == 12:
         hour = 0
     
-    try:
-        return time(hour, minute)
-    except ValueError as e:
-        raise ValueError(f"Invalid time: {time_str}") from e
+    # Check the range up front rather than catching the error from time()
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Invalid time: {time_str}")
+    
+    return time(hour, minute)
 
 
-def parse_day_range(day_str: str):
+@functools.lru_cache(maxsize=256)
+def parse_day_range(day_str: str) -> tuple[int, ...]:
     """
     Parse a day range by mapping day strings to weekday integers.
     
-    Returns a list of weekday numbers (0=Monday, ..., 6=Sunday).
+    Returns a sorted tuple of weekday numbers (0=Monday, ..., 6=Sunday).
+    Results are cached, since the same day ranges repeat across restaurants.
     """
-    day_mapping = {
-        'mon': 0, 'tue': 1, 'tues': 1, 'wed': 2, 'thu': 3, 'thurs': 3,
-        'fri': 4, 'sat': 5, 'sun': 6
-    }
-    
     day_str = day_str.strip().lower()
-    days = []
+    
+    # Fast path for a single day (e.g., "Sun")
+    if ',' not in day_str and '-' not in day_str:
+        if day_str not in _DAY_MAP:
+            raise ValueError(f"Unknown day: {day_str}")
+        return (_DAY_MAP[day_str],)
+    
+    days = set()
     
     # Handle comma-separated days
     for part in day_str.split(','):
@@ -74,48 +96,36 @@ def parse_day_range(day_str: str):
             start_day = start_day.strip()
             end_day = end_day.strip()
             
-            if start_day not in day_mapping or end_day not in day_mapping:
+            if start_day not in _DAY_MAP or end_day not in _DAY_MAP:
                 raise ValueError(f"Unknown day in range: {part}")
             
-            start_idx = day_mapping[start_day]
-            end_idx = day_mapping[end_day]
+            start_idx = _DAY_MAP[start_day]
+            end_idx = _DAY_MAP[end_day]
             
             # Handle week wraparound (e.g., "Sat-Mon")
             if start_idx <= end_idx:
-                days.extend(range(start_idx, end_idx + 1))
+                days.update(range(start_idx, end_idx + 1))
             else:
-                days.extend(range(start_idx, 7))
-                days.extend(range(0, end_idx + 1))
+                days.update(range(start_idx, 7))
+                days.update(range(0, end_idx + 1))
         else:
             # Single day
-            if part not in day_mapping:
+            if part not in _DAY_MAP:
                 raise ValueError(f"Unknown day: {part}")
-            days.append(day_mapping[part])
-    
-    return sorted(list(set(days)))
-
-
-def parse_time_range(time_range_str: str):
-    """
-    Parse a time range from a string input into a proper TimeRange object.
-
-    """
-    if '-' not in time_range_str:
-        raise ValueError(f"No time range separator found: {time_range_str}")
-    
-    start_str, end_str = time_range_str.split('-', 1)
-    start_time = parse_time_string(start_str.strip())
-    end_time = parse_time_string(end_str.strip())
+            days.add(_DAY_MAP[part])
     
-    return TimeRange(start=start_time, end=end_time)
+    return tuple(sorted(days))
 
 
-def parse_restaurant_hours(hours_str: str):
+def _parse_hours(hours_str: str) -> tuple[dict, tuple[int, ...]]:
     """
-    Parse restaurant hours from day and time range data into a schedule dictionary.
+    Parse restaurant hours into a schedule dictionary and the days it opens on.
     
+    The opening days are the weekdays listed in the hours, without the days
+    that only receive overnight carry-over from the day before.
     """
     schedule = {}
+    open_days = set()
     
     # Split by '/' to handle multiple time periods
     time_periods = [period.strip() for period in hours_str.split('/')]
@@ -125,60 +135,78 @@ def parse_restaurant_hours(hours_str: str):
         if not period:
             continue
             
-        # Find the time range part (everything after the last comma or beginning)
-        # Look for pattern: days, time_range
-        parts = period.rsplit(' ', 3)  # Split from right to get last 3 parts (time range)
-        
-        if len(parts) < 4:
+        # Split the period into its days part and start/end times in one match
+        match = _PERIOD_RE.match(period)
+        if not match:
             raise ValueError(f"Cannot parse time period: {period}")
         
-        days_part = ' '.join(parts[:-3])
-        time_range_part = ' '.join(parts[-3:])
-        
-        try:
-            days = parse_day_range(days_part)
-            time_range = parse_time_range(time_range_part)
-        except ValueError:
-            # Try alternative parsing, used format might not be consistent
-            # Looks for pattern where time starts with digit
-            match = re.search(r'(\d{1,2}(?::\d{2})?\s*(?:am|pm))', period, re.IGNORECASE)
-            if not match:
-                raise ValueError(f"Cannot find time in period: {period}")
-            
-            time_start_pos = match.start()
-            days_part = period[:time_start_pos].strip()
-            time_range_part = period[time_start_pos:].strip()
-            
-            days = parse_day_range(days_part)
-            time_range = parse_time_range(time_range_part)
+        days = parse_day_range(match.group(1))
+        open_days.update(days)
+        start_time = parse_time_string(match.group(2))
+        end_time = parse_time_string(match.group(3))
+        start = start_time.hour * 60 + start_time.minute
+        end = end_time.hour * 60 + end_time.minute
         
         # Adds current time range to each day
         for day in days:
-            if day not in schedule:
-                schedule[day] = DaySchedule()
-            schedule[day].time_ranges.append(time_range)
+            if start <= end:
+                schedule.setdefault(day, []).append((start, end))
+            else:
+                # Overnight range, open until midnight then into the next day
+                schedule.setdefault(day, []).append((start, MINUTES_PER_DAY - 1))
+                schedule.setdefault((day + 1) % 7, []).append((0, end))
+    
+    for time_ranges in schedule.values():
+        time_ranges.sort()
     
-    return schedule
+    return schedule, tuple(sorted(open_days))
 
 
-def parse_restaurants_from_csv(csv_content: str):
+def parse_restaurant_hours(hours_str: str):
+    """
+    Parse restaurant hours from day and time range data into a schedule dictionary.
+    
+    Maps each weekday to a sorted list of (start, end) minute-of-day tuples.
+    Overnight ranges are split at midnight, so the early morning part lands
+    on the following day (Sunday night wraps around to Monday).
+    """
+    return _parse_hours(hours_str)[0]
+
+
+def _set_mask_bits(mask: int, first: int, last: int) -> int:
+    """Set every bit from first to last (inclusive) in the mask."""
+    return mask | (((1 << (last - first + 1)) - 1) << first)
+
+
+def build_schedule_mask(schedule: dict) -> int:
     """
-    Read restaurant data from CSV file and parse the opening hours.
+    Pack a weekly schedule into a bitmap with one bit per minute of the week.
+    """
+    mask = 0
+    
+    for day, time_ranges in schedule.items():
+        day_start = day * MINUTES_PER_DAY
+        for start, end in time_ranges:
+            mask = _set_mask_bits(mask, day_start + start, day_start + end)
     
+    return mask
+
+
+def parse_restaurants_from_rows(rows: Iterable[list[str]]):
+    """
+    Parse restaurants from CSV rows, such as a csv.reader over an open file.
+    
+    Rows are consumed one at a time, the first row is treated as the header.
     Skips any restaurants that can't be parsed without stopping.
     """
     restaurants = []
-    
-    # Uses Python's csv module for CSV parsing
-    csv_reader = csv.reader(StringIO(csv_content))
+    rows = iter(rows)
     
     # Skip header line
-    try:
-        next(csv_reader)
-    except StopIteration:
+    if next(rows, None) is None:
         return restaurants  # Empty file
     
-    for row in csv_reader:
+    for row in rows:
         # Skip empty or malformed rows
         if len(row) != 2:
             continue
@@ -186,12 +214,25 @@ def parse_restaurants_from_csv(csv_content: str):
         name, hours = row
         
         try:
-            schedule = parse_restaurant_hours(hours)
-            restaurant = Restaurant(name=name, schedule=schedule)
+            schedule, open_days = _parse_hours(hours)
+            restaurant = Restaurant(
+                name=name,
+                schedule=schedule,
+                mask=build_schedule_mask(schedule),
+                open_days=open_days
+            )
             restaurants.append(restaurant)
         except ValueError as e:
             # Log the error but continue processing other restaurants
             print(f"Warning: Could not parse hours for {name}: {e}")
             continue
     
-    return restaurants 
\ No newline at end of file
+    return restaurants
+
+
+def parse_restaurants_from_csv(csv_content: str):
+    """
+    Read restaurant data from CSV text and parse the opening hours.
+    """
+    # Uses Python's csv module for CSV parsing
+    return parse_restaurants_from_rows(csv.reader(StringIO(csv_content)))
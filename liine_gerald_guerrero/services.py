@@ -4,9 +4,70 @@ Main service used for handling restaurant data.
 Module containes the business logic for loading and providing processed restaurant data.
 """
 
+import csv
 import os
+import re
+from bisect import bisect_right
+from datetime import datetime
+import numpy as np
 from dateutil import parser as date_parser
-from .parsers import parse_restaurants_from_csv
+from .models import MINUTES_PER_DAY, MINUTES_PER_WEEK
+from .parsers import parse_restaurants_from_csv, parse_restaurants_from_rows
+
+
+# Short "Mon 11:30 am" style queries, parsed without going through dateutil
+_WEEKDAY_TIME_RE = re.compile(
+    r'^(mon|tue|wed|thu|fri|sat|sun)\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)$', re.IGNORECASE
+)
+_WEEKDAYS = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+_WEEK_MASK = (1 << MINUTES_PER_WEEK) - 1
+
+
+def _parse_query_time(datetime_str: str) -> tuple[int, int, int]:
+    """
+    Parse a query datetime string into a (weekday, hour, minute) tuple.
+    
+    ISO strings and "Mon 11:30 am" style strings are handled directly,
+    anything else falls back to dateutil.
+    """
+    try:
+        query_datetime = datetime.fromisoformat(datetime_str)
+        return query_datetime.weekday(), query_datetime.hour, query_datetime.minute
+    except ValueError:
+        pass
+    
+    match = _WEEKDAY_TIME_RE.match(datetime_str.strip())
+    if match:
+        hour = int(match.group(2))
+        minute = int(match.group(3)) if match.group(3) else 0
+        if 1 <= hour <= 12 and minute < 60:
+            hour %= 12
+            if match.group(4).lower() == 'pm':
+                hour += 12
+            return _WEEKDAYS[match.group(1).lower()], hour, minute
+    
+    query_datetime = date_parser.parse(datetime_str)
+    return query_datetime.weekday(), query_datetime.hour, query_datetime.minute
+
+
+def _find_change_minutes(masks) -> list[int]:
+    """
+    Return the sorted minutes of the week where any restaurant opens or closes.
+    
+    Minute 0 is always included so every minute falls after some change point,
+    which also covers any change between Sunday night and Monday morning.
+    """
+    changes = 1
+    for mask in masks:
+        # Compare each minute with the one before it
+        previous = (mask << 1) & _WEEK_MASK
+        changes |= mask ^ previous
+    
+    change_bits = np.unpackbits(
+        np.frombuffer(changes.to_bytes(MINUTES_PER_WEEK // 8, 'little'), dtype=np.uint8),
+        bitorder='little'
+    )
+    return np.flatnonzero(change_bits).tolist()
 
 
 class RestaurantService:
@@ -15,8 +76,68 @@ class RestaurantService:
     def __init__(self):
         """Initialize RestaurantService class with no data by default"""
         self._restaurants = []
+        self._bitmap = np.zeros((0, MINUTES_PER_WEEK // 8), dtype=np.uint8)
+        self._names = np.array([], dtype=object)
+        self._by_day = [[] for _ in range(7)]
+        self._by_name_lower = {}
+        self._change_minutes = [0]
+        self._snapshots = [()]
         self._loaded = False
     
+    def _set_restaurants(self, restaurants) -> None:
+        """
+        Store parsed restaurants and build the lookup arrays used by queries.
+        
+        Restaurants are sorted by name once here so query results keep that
+        order without sorting per request. Weekly bitmaps are kept as one
+        uint8 row per restaurant with a parallel array of names, so an open
+        check is a single column operation.
+        """
+        # Case-insensitive name index, built in file order so the first restaurant
+        # in the CSV wins on duplicate names
+        self._by_name_lower = {}
+        for restaurant in restaurants:
+            self._by_name_lower.setdefault(restaurant.name.lower(), restaurant)
+        
+        self._restaurants = sorted(restaurants, key=lambda restaurant: restaurant.name)
+        packed_masks = b''.join(
+            restaurant.mask.to_bytes(MINUTES_PER_WEEK // 8, 'little') for restaurant in self._restaurants
+        )
+        self._bitmap = np.frombuffer(packed_masks, dtype=np.uint8).reshape(
+            len(self._restaurants), MINUTES_PER_WEEK // 8
+        )
+        self._names = np.array([restaurant.name for restaurant in self._restaurants], dtype=object)
+        
+        # Names open on each weekday, already in sorted order. Uses the listed
+        # opening days so overnight carry-over doesn't count as opening that day
+        self._by_day = [[] for _ in range(7)]
+        for restaurant in self._restaurants:
+            for weekday in restaurant.open_days:
+                self._by_day[weekday].append(restaurant.name)
+        
+        # Open restaurants only change at a few minutes each week, so precompute
+        # the answer at every change point and look it up per query
+        self._change_minutes = _find_change_minutes(restaurant.mask for restaurant in self._restaurants)
+        self._snapshots = self._scan_open_at_minutes(self._change_minutes)
+        self._loaded = True
+    
+    def _scan_open_at_minutes(self, week_minutes: list[int]) -> list[tuple[str, ...]]:
+        """
+        Return the sorted names of restaurants open at each given minute of the week.
+        
+        The bits for every restaurant and every minute are gathered from the
+        bitmap in a single vectorized step.
+        """
+        byte_idx, bits = np.divmod(np.asarray(week_minutes, dtype=np.intp), 8)
+        open_matrix = ((self._bitmap[:, byte_idx] >> bits.astype(np.uint8)) & 1).astype(bool)
+        return [tuple(self._names[hits].tolist()) for hits in open_matrix.T]
+    
+    def _open_at_minute(self, week_minute: int) -> tuple[str, ...]:
+        """
+        Return the precomputed names open at a given minute of the week.
+        """
+        return self._snapshots[bisect_right(self._change_minutes, week_minute) - 1]
+    
     def load_restaurants_from_csv(self, csv_file_path: str) -> None:
         """
         Load restaurant data from a given CSV file.
@@ -24,11 +145,11 @@ class RestaurantService:
         if not os.path.exists(csv_file_path):
             raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
         
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
-            csv_content = file.read()
+        # Stream rows straight from the file instead of reading it all into memory
+        with open(csv_file_path, 'r', newline='', encoding='utf-8') as file:
+            restaurants = parse_restaurants_from_rows(csv.reader(file))
         
-        self._restaurants = parse_restaurants_from_csv(csv_content)
-        self._loaded = True
+        self._set_restaurants(restaurants)
         
         print(f"Loaded {len(self._restaurants)} restaurants from {csv_file_path}")
     
@@ -36,8 +157,7 @@ class RestaurantService:
         """
         Load restaurant data from CSV text using raw text in place of filename (meant for testing).
         """
-        self._restaurants = parse_restaurants_from_csv(csv_content)
-        self._loaded = True
+        self._set_restaurants(parse_restaurants_from_csv(csv_content))
         
         print(f"Loaded {len(self._restaurants)} restaurants from content")
     
@@ -68,28 +188,21 @@ class RestaurantService:
         if not self._loaded:
             raise RuntimeError("Restaurant data not loaded. Call load_restaurants_from_csv first.")
         
-        # Parse the datetime string using dateutil
+        # Parse the datetime string, falling back to dateutil for unusual formats
         try:
-            query_datetime = date_parser.parse(datetime_str)
+            weekday, hour, minute = _parse_query_time(datetime_str)
         except Exception as e:
             raise ValueError(f"Invalid datetime format: {datetime_str}") from e
         
-        # Find open restaurants
-        open_restaurants = []
-        for restaurant in self._restaurants:
-            if restaurant.is_open_at_datetime(query_datetime):
-                open_restaurants.append(restaurant.name)
-        
-        return sorted(open_restaurants)  # Return sorted for consistency
+        # Served from the snapshot taken at the last change point before this minute
+        week_minute = weekday * MINUTES_PER_DAY + hour * 60 + minute
+        return list(self._open_at_minute(week_minute))
     
     def get_restaurant_by_name(self, name: str):
         """
         Finds and returns a restaurant by name, not case sensitive.
         """
-        for restaurant in self._restaurants:
-            if restaurant.name.lower() == name.lower():
-                return restaurant
-        return None
+        return self._by_name_lower.get(name.lower())
     
     def get_restaurants_open_on_day(self, weekday: int):
         """
@@ -103,9 +216,4 @@ class RestaurantService:
         if not self._loaded:
             raise RuntimeError("Restaurant data not loaded. Call load_restaurants_from_csv first.")
         
-        open_restaurants = []
-        for restaurant in self._restaurants:
-            if weekday in restaurant.schedule:
-                open_restaurants.append(restaurant.name)
-        
-        return sorted(open_restaurants) 
\ No newline at end of file
+        return list(self._by_day[weekday])
@@ -1,6 +1,6 @@
 import pytest
 from fastapi.testclient import TestClient
-from datetime import time
+from datetime import datetime, time
 
 from liine_gerald_guerrero.main import app, restaurant_service
 from liine_gerald_guerrero.parsers import (
@@ -8,7 +8,7 @@ from liine_gerald_guerrero.parsers import (
     parse_restaurant_hours,
     parse_restaurants_from_csv,
 )
-from liine_gerald_guerrero.models import TimeRange
+from liine_gerald_guerrero.services import RestaurantService
 
 
 @pytest.fixture
@@ -58,6 +58,14 @@ class TestCoreAPI:
         # Checks to ensure business hours have more open restaurants than 3 AM
         assert len(day_data["restaurants"]) >= len(night_data["restaurants"])
     
+    def test_restaurants_open_weekday_time_format(self, client_with_data):
+        """Test the short "Mon 11:30 am" datetime format used in the assignment."""
+        response = client_with_data.get("/restaurants/open?datetime=Sat 1:30 am")
+
+        assert response.status_code == 200
+        # Only the late night spot is still open from Friday night
+        assert response.json()["restaurants"] == ["Late Night Spot"]
+
     def test_invalid_datetime_handling(self, client_with_data):
         """Test to ensure invalid datetime strings are handled correctly."""
         response = client_with_data.get("/restaurants/open?datetime=invalid-date")
@@ -84,9 +92,7 @@ class TestCoreParser:
         assert len(schedule) == 7
         for day in range(7):
             assert day in schedule
-            assert len(schedule[day].time_ranges) == 1
-            assert schedule[day].time_ranges[0].start == time(11, 0)
-            assert schedule[day].time_ranges[0].end == time(22, 0)
+            assert schedule[day] == [(11 * 60, 22 * 60)]  # 11 AM - 10 PM in minutes
     
     def test_parse_complex_hours_with_different_schedules(self):
         """Test parsing for complex input with different schedules for different days."""
@@ -98,13 +104,13 @@ class TestCoreParser:
         weekday_days = [0, 1, 2, 3, 6]  # Mon-Thu, Sun
         for day in weekday_days:
             assert day in schedule
-            assert schedule[day].time_ranges[0].end == time(22, 0)
+            assert schedule[day][0][1] == 22 * 60
         
         # Friday-Saturday: 11:30 AM - 11 PM  
         weekend_days = [4, 5]  # Fri-Sat
         for day in weekend_days:
             assert day in schedule
-            assert schedule[day].time_ranges[0].end == time(23, 0)
+            assert schedule[day][0][1] == 23 * 60
     
     def test_parse_overnight_hours(self):
         """Test parsing for hours that go past midnight, needed to fully check schedule"""
@@ -112,24 +118,12 @@ class TestCoreParser:
         
         for day in [0, 1, 2]:  # Mon-Wed
             assert day in schedule
-            time_range = schedule[day].time_ranges[0]
-            assert time_range.start == time(17, 0)  # 5 PM
-            assert time_range.end == time(2, 0)     # 2 AM
-    
-    def test_overnight_time_logic(self):
-        """Test ensures overnight time ranges work as intented."""
-        # Create overnight time range: 11 PM - 2 AM
-        time_range = TimeRange(start=time(23, 0), end=time(2, 0))
+            assert (17 * 60, 24 * 60 - 1) in schedule[day]  # 5 PM until midnight
         
-        # should be open at 11 PM, midnight, 1 AM, 2 AM
-        assert time_range.contains_time(time(23, 0))   # 11 PM
-        assert time_range.contains_time(time(0, 0))    # Midnight
-        assert time_range.contains_time(time(1, 0))    # 1 AM
-        assert time_range.contains_time(time(2, 0))    # 2 AM
-        
-        # should be closed at 10 PM and 3 AM
-        assert not time_range.contains_time(time(22, 0))  # 10 PM
-        assert not time_range.contains_time(time(3, 0))   # 3 AM
+        # Early morning hours carry over into the following day
+        for day in [1, 2, 3]:  # Tue-Thu
+            assert (0, 2 * 60) in schedule[day]  # Midnight - 2 AM
+        assert schedule[3] == [(0, 2 * 60)]
     
     def test_parse_csv_data(self):
         """Test parsing of the CSV format used in data processing."""
@@ -160,6 +154,18 @@ class TestCoreParser:
         # Invalid format should raise error
         with pytest.raises(ValueError):
             parse_time_string("invalid")
+        
+        # Out of range times should raise error
+        with pytest.raises(ValueError):
+            parse_time_string("13 pm")
+    
+    def test_parse_invalid_hours(self):
+        """Test that periods without a valid time range are rejected."""
+        with pytest.raises(ValueError, match="Cannot parse time period"):
+            parse_restaurant_hours("Mon-Fri 9 to 5")
+        
+        with pytest.raises(ValueError, match="Unknown day"):
+            parse_restaurant_hours("Someday 9 am - 5 pm")
 
 
 class TestBusinessLogic:
@@ -175,4 +181,82 @@ class TestBusinessLogic:
         
         # Should NOT have Saturday or Sunday: 5-6
         assert 5 not in schedule  # Saturday
-        assert 6 not in schedule  # Sunday 
\ No newline at end of file
+        assert 6 not in schedule  # Sunday
+    
+    def test_overnight_hours_carry_into_next_day(self):
+        """Test that overnight hours stay open past midnight into the following day."""
+        csv_content = '''\"Restaurant Name\",\"Hours\"
+\"Late Night Spot\",\"Sun 5 pm - 2 am\"'''
+        
+        restaurant = parse_restaurants_from_csv(csv_content)[0]
+        
+        # Sunday night runs into Monday morning
+        assert restaurant.is_open_at_datetime(datetime(2023, 12, 24, 23, 0))  # Sun 11 PM
+        assert restaurant.is_open_at_datetime(datetime(2023, 12, 25, 1, 30))  # Mon 1:30 AM
+        assert not restaurant.is_open_at_datetime(datetime(2023, 12, 25, 3, 0))  # Mon 3 AM
+        # Early Sunday morning belongs to Saturday night, which is closed
+        assert not restaurant.is_open_at_datetime(datetime(2023, 12, 24, 1, 0))
+    
+    def test_closing_at_midnight_is_inclusive(self):
+        """Test that a restaurant closing at 12 am is still open at midnight."""
+        csv_content = '''\"Restaurant Name\",\"Hours\"
+\"Midnight Close\",\"Mon 11 am - 12 am\"'''
+        
+        restaurant = parse_restaurants_from_csv(csv_content)[0]
+        
+        assert restaurant.is_open_at_datetime(datetime(2023, 12, 25, 23, 59))  # Mon 11:59 PM
+        assert restaurant.is_open_at_datetime(datetime(2023, 12, 26, 0, 0))  # Tue 12 AM
+        assert not restaurant.is_open_at_datetime(datetime(2023, 12, 26, 0, 1))  # Tue 12:01 AM
+    
+    def test_restaurants_open_on_day(self):
+        """Test the per-day lookup only lists restaurants with hours on that day, sorted by name."""
+        service = RestaurantService()
+        service.load_restaurants_from_content('''\"Restaurant Name\",\"Hours\"
+\"Weekday Only\",\"Mon-Fri 9 am - 5 pm\"
+\"All Week\",\"Mon-Sun 11:00 am - 10 pm\"
+\"Sunday Late\",\"Sun 5 pm - 2 am\"''')
+
+        # Sunday night hours carrying into Monday don't make it a Monday opening
+        assert service.get_restaurants_open_on_day(0) == ["All Week", "Weekday Only"]
+        assert service.get_restaurants_open_on_day(6) == ["All Week", "Sunday Late"]
+        
+        with pytest.raises(ValueError):
+            service.get_restaurants_open_on_day(7)
+    
+    def test_open_lookup_at_change_points(self):
+        """Test open lookups between, and exactly at, opening and closing minutes."""
+        service = RestaurantService()
+        service.load_restaurants_from_content('''\"Restaurant Name\",\"Hours\"
+\"Lunch Spot\",\"Mon 11 am - 2 pm\"
+\"Sunday Late\",\"Sun 11 pm - 2 am\"''')
+        
+        # Sunday night wraps into Monday morning, ends are inclusive
+        assert service.find_open_restaurants("Sun 10:59 pm") == []
+        assert service.find_open_restaurants("Sun 11 pm") == ["Sunday Late"]
+        assert service.find_open_restaurants("Sun 11:59 pm") == ["Sunday Late"]
+        assert service.find_open_restaurants("Mon 12 am") == ["Sunday Late"]
+        assert service.find_open_restaurants("Mon 1 am") == ["Sunday Late"]
+        assert service.find_open_restaurants("Mon 2 am") == ["Sunday Late"]
+        assert service.find_open_restaurants("Mon 2:01 am") == []
+        
+        # Exact open and close minutes, and a minute between change points
+        assert service.find_open_restaurants("Mon 10:59 am") == []
+        assert service.find_open_restaurants("Mon 11 am") == ["Lunch Spot"]
+        assert service.find_open_restaurants("Mon 12:30 pm") == ["Lunch Spot"]
+        assert service.find_open_restaurants("Mon 2 pm") == ["Lunch Spot"]
+        assert service.find_open_restaurants("Mon 2:01 pm") == []
+        
+        # A schedule with no opening or closing minutes still answers every query
+        service.load_restaurants_from_content('''\"Restaurant Name\",\"Hours\"
+\"Always Open\",\"Mon-Sun 12 am - 11:59 pm\"''')
+        assert service.find_open_restaurants("Wed 3:15 am") == ["Always Open"]
+    
+    def test_restaurant_by_name_prefers_first_in_file(self):
+        """Test that names differing only in case resolve to the first one in the CSV."""
+        service = RestaurantService()
+        service.load_restaurants_from_content('''\"Restaurant Name\",\"Hours\"
+\"abc\",\"Mon-Fri 9 am - 5 pm\"
+\"ABC\",\"Sat-Sun 9 am - 5 pm\"''')
+        
+        assert service.get_restaurant_by_name("ABC").name == "abc"
+        assert service.get_restaurant_by_name("missing") is None